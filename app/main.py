@@ -1,3 +1,6 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
@@ -5,10 +8,25 @@ from fastapi.responses import FileResponse
 from app.routes import tts, pipeline
 from app.routes import chat as chat_routes  
 from app.routes import ws as ws_routes 
+from app.routes import health as health_routes
+from app.services import readiness
 
 from app.utils.config import STATIC_DIR
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    # Warm provider connections before accepting traffic
+    await readiness.warm_up_all()
+    recheck = asyncio.create_task(readiness.recheck_forever())
+    try:
+        yield
+    finally:
+        recheck.cancel()
+        with suppress(asyncio.CancelledError):
+            await recheck
+        readiness.shutdown()
+
+app = FastAPI(lifespan=lifespan)
 
 app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
 
@@ -16,6 +34,7 @@ app.include_router(tts.router)
 app.include_router(pipeline.router)
 app.include_router(chat_routes.router)    
 app.include_router(ws_routes.router)   
+app.include_router(health_routes.router)
 
 @app.get("/")
 async def root():
@@ -0,0 +1,19 @@
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from app.services.readiness import get_status
+
+router = APIRouter()
+
+@router.get("/healthz")
+def healthz():
+    return {"status": "ok"}
+
+@router.get("/readyz")
+async def readyz():
+    providers = get_status()
+    ready = all(s["ready"] for s in providers.values())
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={"status": "ready" if ready else "not_ready", "providers": providers},
+    )
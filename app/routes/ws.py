@@ -5,18 +5,9 @@ from app.utils.config import RECORDINGS_DIR
 import json
 import os
 import asyncio
-import assemblyai as aai
 from app.utils.config import ASSEMBLY_API_KEY
-from groq import Groq
-from app.utils.config import GROQ_API_KEY
+from app.services.llm import get_client as get_groq_client
 from app.services.murf_ws import stream_llm_to_murf_with_client_forwarding
-from assemblyai.streaming.v3.client import (
-    StreamingClient,
-    StreamingClientOptions,
-    StreamingEvents,
-    StreamingParameters,
-)
-from assemblyai.streaming.v3.models import Encoding
 
 router = APIRouter()
 
@@ -123,7 +114,15 @@ async def ws_transcribe(ws: WebSocket):
             await ws.close()
         return
 
-    # Configure AssemblyAI Universal Streaming (v3)
+    # Configure AssemblyAI Universal Streaming (v3); imported here to keep startup light
+    from assemblyai.streaming.v3.client import (
+        StreamingClient,
+        StreamingClientOptions,
+        StreamingEvents,
+        StreamingParameters,
+    )
+    from assemblyai.streaming.v3.models import Encoding
+
     loop = asyncio.get_event_loop()
 
     async def _send_json(payload: dict) -> None:
@@ -156,7 +155,7 @@ async def ws_transcribe(ws: WebSocket):
     async def _stream_llm_response(transcript: str):
         """Stream LLM response and send chunks to client"""
         try:
-            groq_client = Groq(api_key=GROQ_API_KEY)
+            groq_client = get_groq_client()
             
             # Build conversation context
             messages = [
@@ -1,9 +1,41 @@
-import assemblyai as aai
+import threading
 from app.utils.config import ASSEMBLY_API_KEY
 
-aai.settings.api_key = ASSEMBLY_API_KEY
+# Keep pooled connections longer than the readiness re-probe interval (httpx defaults to 5s)
+KEEPALIVE_EXPIRY = 120.0
+
+_aai = None
+_sdk_lock = threading.Lock()
+
+def get_sdk():
+    """Import and configure the AssemblyAI SDK on first use."""
+    global _aai
+    if _aai is None:
+        with _sdk_lock:
+            if _aai is None:
+                import assemblyai as aai
+                aai.settings.api_key = ASSEMBLY_API_KEY
+                aai.settings.keepalive_expiry = KEEPALIVE_EXPIRY
+                _aai = aai
+    return _aai
+
+def warm_up() -> None:
+    aai = get_sdk()
+    # Load the realtime client now so the first /ws/transcribe session doesn't import it on the event loop
+    import assemblyai.streaming.v3.client  # noqa: F401
+    # Opens (or refreshes) a pooled TLS connection on the SDK's shared HTTP client
+    r = aai.Client.get_default().http_client.get("/v2/transcript", params={"limit": 1}, timeout=10)
+    r.raise_for_status()
+
+def close() -> None:
+    global _aai
+    with _sdk_lock:
+        if _aai is not None:
+            _aai.Client.get_default().http_client.close()
+            _aai = None
 
 def transcribe_bytes(audio_bytes: bytes, model: str = "slam_1") -> str:
+    aai = get_sdk()
     transcriber = aai.Transcriber()
     config = aai.TranscriptionConfig(speech_model=getattr(aai.SpeechModel, model))
     transcript = transcriber.transcribe(audio_bytes, config)
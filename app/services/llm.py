@@ -1,15 +1,44 @@
-from groq import Groq
+import threading
 from app.utils.config import GROQ_API_KEY
 
-client = Groq(api_key=GROQ_API_KEY)
+# Keep pooled connections longer than the readiness re-probe interval (httpx defaults to 5s)
+KEEPALIVE_EXPIRY = 120.0
+
+_client = None
+_client_lock = threading.Lock()
 
 SYSTEM_MSG = (
     "You are a helpful AI assistant. Answer succinctly in your own words. "
     "Do not repeat the user's question. Keep responses under 3000 characters when possible."
 )
 
+def get_client():
+    """Return the shared Groq client, importing the SDK on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                import httpx
+                from groq import DefaultHttpxClient, Groq
+                http_client = DefaultHttpxClient(limits=httpx.Limits(
+                    max_connections=100, max_keepalive_connections=20, keepalive_expiry=KEEPALIVE_EXPIRY
+                ))
+                _client = Groq(api_key=GROQ_API_KEY, http_client=http_client)
+    return _client
+
+def warm_up() -> None:
+    # Authenticated, cheap call that opens (or refreshes) a pooled TLS connection to Groq
+    get_client().models.list(timeout=10)
+
+def close() -> None:
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
 def chat(prompt: str, model: str = "llama-3.3-70b-versatile", temperature: float = 0.7, max_tokens: int = 1024) -> str:
-    out = client.chat.completions.create(
+    out = get_client().chat.completions.create(
         model=model,
         messages=[
             {"role": "system", "content": SYSTEM_MSG},
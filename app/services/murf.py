@@ -1,7 +1,36 @@
+import threading
 import requests
 from fastapi import HTTPException
 from app.utils.config import MURF_API_KEY, MAX_MURF_CHARS, DEFAULT_VOICE
 
+MURF_BASE_URL = "https://api.murf.ai"
+
+_session = None
+_session_lock = threading.Lock()
+
+def get_session() -> requests.Session:
+    """Return the shared HTTP session so Murf calls reuse pooled connections."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                session.headers.update({"api-key": MURF_API_KEY or ""})
+                _session = session
+    return _session
+
+def warm_up() -> None:
+    # Authenticated, cheap call that opens (or refreshes) a pooled TLS connection to Murf
+    r = get_session().get(f"{MURF_BASE_URL}/v1/speech/voices", timeout=10)
+    r.raise_for_status()
+
+def close() -> None:
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
 def split_for_tts(text: str, max_len: int = MAX_MURF_CHARS):
     import re
     chunks, current, cur_len = [], [], 0
@@ -25,10 +54,10 @@ def split_for_tts(text: str, max_len: int = MAX_MURF_CHARS):
 def murf_generate(text: str, voice_id: str = DEFAULT_VOICE) -> str:
     if not MURF_API_KEY:
         raise HTTPException(status_code=500, detail="Murf API key not configured")
-    url = "https://api.murf.ai/v1/speech/generate"
+    url = f"{MURF_BASE_URL}/v1/speech/generate"
     headers = {"Content-Type": "application/json", "api-key": MURF_API_KEY}
     payload = {"text": text, "voiceId": voice_id}
-    r = requests.post(url, headers=headers, json=payload, timeout=45)
+    r = get_session().post(url, headers=headers, json=payload, timeout=45)
     try:
         r.raise_for_status()
     except requests.exceptions.RequestException as e:
@@ -0,0 +1,67 @@
+import asyncio
+import time
+from typing import Callable, Dict
+
+from app.services import asr, llm, murf
+from app.utils.config import ASSEMBLY_API_KEY, GROQ_API_KEY, MURF_API_KEY
+
+WARMUP_TIMEOUT = 15.0
+# Re-probe interval; also acts as a keep-alive ping, so keep it below the clients' keep-alive expiry
+RECHECK_INTERVAL = 60.0
+
+# provider name -> (api key, warm-up callable)
+PROVIDERS: Dict[str, tuple] = {
+    "groq": (GROQ_API_KEY, llm.warm_up),
+    "murf": (MURF_API_KEY, murf.warm_up),
+    "assemblyai": (ASSEMBLY_API_KEY, asr.warm_up),
+}
+
+# provider name -> {"ready": bool, "detail": str, "latency_ms": float | None}
+provider_status: Dict[str, Dict] = {
+    name: {"ready": False, "detail": "pending", "latency_ms": None} for name in PROVIDERS
+}
+
+
+async def _warm_provider(name: str, api_key, warm: Callable[[], None]) -> None:
+    if not api_key:
+        provider_status[name] = {"ready": False, "detail": "API key not configured", "latency_ms": None}
+        return
+    previous = provider_status[name]["detail"]
+    start = time.perf_counter()
+    try:
+        await asyncio.wait_for(asyncio.to_thread(warm), timeout=WARMUP_TIMEOUT)
+    except asyncio.TimeoutError:
+        provider_status[name] = {"ready": False, "detail": f"warm-up timed out after {WARMUP_TIMEOUT:.0f}s", "latency_ms": None}
+    except Exception as e:
+        provider_status[name] = {"ready": False, "detail": f"warm-up failed: {e}", "latency_ms": None}
+    else:
+        latency_ms = round((time.perf_counter() - start) * 1000, 1)
+        provider_status[name] = {"ready": True, "detail": "ok", "latency_ms": latency_ms}
+    if provider_status[name]["detail"] != previous:
+        print(f"Warm-up {name}: {provider_status[name]['detail']}")
+
+
+async def warm_up_all() -> Dict[str, Dict]:
+    """Pre-open pooled connections to every provider concurrently."""
+    await asyncio.gather(*(_warm_provider(name, key, warm) for name, (key, warm) in PROVIDERS.items()))
+    return provider_status
+
+
+async def recheck_forever() -> None:
+    """Periodically re-probe every provider so failed warm-ups recover and pooled connections stay open."""
+    while True:
+        await asyncio.sleep(RECHECK_INTERVAL)
+        await warm_up_all()
+
+
+def get_status() -> Dict[str, Dict]:
+    """Return a snapshot of per-provider readiness."""
+    return {name: dict(status) for name, status in provider_status.items()}
+
+
+def shutdown() -> None:
+    for name, close in (("groq", llm.close), ("murf", murf.close), ("assemblyai", asr.close)):
+        try:
+            close()
+        except Exception as e:
+            print(f"Error closing {name} client: {str(e)}")